@@ -3,90 +3,236 @@
 CLI tool to process YouTube transcripts into organized Rust learning markdown.
 
 Usage:
-    python process_transcript.py <youtube_url> [--push] [--overwrite]
+    python process_transcript.py <youtube_url> [--push] [--overwrite] [--no-cache]
+    python process_transcript.py --batch <urls.txt> [--push] [--overwrite] [--no-cache]
 
 Examples:
     python process_transcript.py "https://youtu.be/QQzAWxYKPSE"
     python process_transcript.py "https://youtu.be/QQzAWxYKPSE" --push
     python process_transcript.py "https://youtu.be/QQzAWxYKPSE" --overwrite
+    python process_transcript.py --batch playlist-urls.txt --push
 
 Options:
-    --push       Git add, commit, and push after saving (can also set AUTO_PUSH=true in .env)
-    --overwrite  Overwrite existing document if video was already processed
+    --push        Git add, commit, and push after saving (can also set AUTO_PUSH=true in .env)
+    --overwrite   Overwrite existing document if video was already processed
+    --no-cache    Skip the local transcript cache and re-fetch from YouTube
+    --batch FILE  Process every URL listed in FILE (one per line) concurrently
 """
 
+from __future__ import annotations
+
 import sys
 import os
+import hashlib
+import io
+import json
 import re
 import subprocess
+import time
+import zlib
 from pathlib import Path
-from dotenv import load_dotenv
-import anthropic
-import yaml
 
-# Add the youtube transcript api to path
-sys.path.insert(0, str(Path(__file__).parent / "external" / "youtube-transcript-api"))
-from youtube_transcript_api import YouTubeTranscriptApi
+# anthropic, yaml, dotenv, and the transcript API are imported lazily inside
+# the functions that need them: cold startup (e.g. --help) stays fast because
+# none of their heavy dependency trees load until actually used
+
+# Vendored youtube transcript api location
+_YT_API_PATH = str(Path(__file__).parent / "external" / "youtube-transcript-api")
+
+
+def _transcript_api():
+    """Import YouTubeTranscriptApi on first use."""
+    if _YT_API_PATH not in sys.path:
+        sys.path.insert(0, _YT_API_PATH)
+    from youtube_transcript_api import YouTubeTranscriptApi
+    return YouTubeTranscriptApi
+
+
+def _load_yaml():
+    """Import yaml on first use, preferring the libyaml C loader/dumper."""
+    import yaml
+    try:
+        # libyaml C bindings parse/dump roughly an order of magnitude faster
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:
+        return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+
+# orjson is several times faster than stdlib json for the cache files;
+# fall back silently when it isn't installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+
+# Local cache root shared by the transcript, title, and video-id caches
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+# Matches youtu.be/ID, youtube.com/watch?v=ID, /embed/ID, /v/ID, or a bare ID
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([a-zA-Z0-9_-]{11})'
+    r'|^([a-zA-Z0-9_-]{11})$'
+)
 
 
 def extract_video_id(url: str) -> str:
     """Extract YouTube video ID from various URL formats."""
-    patterns = [
-        r'youtu\.be/([a-zA-Z0-9_-]{11})',           # youtu.be/ID
-        r'youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})', # youtube.com/watch?v=ID
-        r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',   # youtube.com/embed/ID
-        r'youtube\.com/v/([a-zA-Z0-9_-]{11})',       # youtube.com/v/ID
-        r'^([a-zA-Z0-9_-]{11})$',                    # Just the ID
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1) or match.group(2)
 
     raise ValueError(f"Could not extract video ID from: {url}")
 
 
+# Sidecar index mapping video_id -> doc path, maintained by save_document,
+# so duplicate checks don't have to scan every file under docs/
+VIDEO_INDEX_PATH = CACHE_DIR / "video_index.json"
+
+
+def _load_video_index() -> dict:
+    try:
+        return _json_loads(VIDEO_INDEX_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_video_path(video_id: str, filepath: Path):
+    """Record where a video's document was saved."""
+    VIDEO_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    index = _load_video_index()
+    index[video_id] = str(filepath)
+    VIDEO_INDEX_PATH.write_text(_json_dumps(index))
+
+
 def find_existing_document(video_id: str, docs_dir: Path) -> Path | None:
     """Check if a document with this video ID already exists."""
     if not docs_dir.exists():
         return None
 
+    # Fast path: O(1) lookup in the sidecar index
+    cached = _load_video_index().get(video_id)
+    if cached and Path(cached).exists():
+        return Path(cached)
+
+    # Fallback scan: the marker sits at the end of the file, so only probe
+    # the first 4KB and last 1KB instead of reading whole documents
+    marker = f"<!-- VideoId: {video_id} -->".encode()
+
     for md_file in docs_dir.rglob("*.md"):
         try:
-            content = md_file.read_text()
-            if f"<!-- VideoId: {video_id} -->" in content:
-                return md_file
+            with open(md_file, 'rb') as f:
+                head = f.read(4096)
+                if marker in head:
+                    return md_file
+                size = f.seek(0, os.SEEK_END)
+                if size > 4096:
+                    # Overlap the regions so a straddling marker isn't missed
+                    f.seek(max(4096 - len(marker), size - 1024))
+                    if marker in f.read():
+                        return md_file
         except Exception:
             continue
 
     return None
 
 
-def fetch_transcript(video_id: str) -> str:
-    """Fetch transcript from YouTube."""
+# Shared HTTP session so batch runs reuse connections instead of paying a
+# TCP + TLS handshake per video
+_SESSION = None
+
+
+def _http_session():
+    """Return the shared pooled requests.Session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        _SESSION = requests.Session()
+        _SESSION.headers['Connection'] = 'keep-alive'
+        _SESSION.mount('https://', HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        ))
+    return _SESSION
+
+
+# Local cache for fetched transcripts (zlib-compressed, one file per video)
+TRANSCRIPT_CACHE_DIR = CACHE_DIR / "transcripts"
+TRANSCRIPT_CACHE_TTL = 7 * 86400  # seconds
+
+
+def _load_cached_transcript(video_id: str) -> str | None:
+    """Return a cached transcript if present and not expired, else None."""
+    cache_path = TRANSCRIPT_CACHE_DIR / f"{video_id}.txt.zz"
+    try:
+        if time.time() - cache_path.stat().st_mtime > TRANSCRIPT_CACHE_TTL:
+            return None
+        return zlib.decompress(cache_path.read_bytes()).decode('utf-8')
+    except (OSError, zlib.error):
+        return None
+
+
+def _store_cached_transcript(video_id: str, transcript: str):
+    """Write a transcript into the local cache."""
+    TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path = TRANSCRIPT_CACHE_DIR / f"{video_id}.txt.zz"
+    cache_path.write_bytes(zlib.compress(transcript.encode('utf-8')))
+
+
+def fetch_transcript(video_id: str, use_cache: bool = True) -> str:
+    """Fetch transcript from YouTube, using the local cache when possible."""
+    if use_cache:
+        cached = _load_cached_transcript(video_id)
+        if cached is not None:
+            print(f"Transcript cache hit for video: {video_id}")
+            return cached
+
     print(f"Fetching transcript for video: {video_id}")
 
-    api = YouTubeTranscriptApi()
-    transcript_parts = []
+    api = _transcript_api()(http_client=_http_session())
 
+    # Write snippets straight into one buffer rather than materializing a
+    # list of parts and then a joined copy
+    buf = io.StringIO()
+    first = True
     for snippet in api.fetch(video_id):
-        transcript_parts.append(snippet.text)
+        if not first:
+            buf.write(' ')
+        buf.write(snippet.text)
+        first = False
 
-    return " ".join(transcript_parts)
+    transcript = buf.getvalue()
 
+    if use_cache:
+        _store_cached_transcript(video_id, transcript)
+
+    return transcript
 
-def process_with_claude(transcript: str, client: anthropic.Anthropic) -> dict:
-    """Send transcript to Claude for processing."""
-    print("Processing transcript with Claude...")
 
-    prompt = f"""You are helping create educational Rust documentation from a YouTube video transcript.
+MODEL = "claude-sonnet-4-20250514"
 
-Here is the raw transcript:
+# Cache of parsed Claude responses keyed by model + prompt content, so
+# --overwrite reruns with an unchanged transcript don't re-bill the API
+CLAUDE_CACHE_DIR = CACHE_DIR / "claude"
 
-<transcript>
-{transcript}
-</transcript>
+# Static instruction block. Kept ahead of the transcript and marked with
+# cache_control so Anthropic's prompt cache can reuse the shared prefix
+# across invocations instead of re-billing it as fresh input tokens.
+PROMPT_INSTRUCTIONS = """You are helping create educational Rust documentation from a YouTube video transcript. The raw transcript follows these instructions.
 
 Please do the following:
 
@@ -121,35 +267,125 @@ IS_RUST: <yes/no>
 <the markdown content>
 """
 
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=8192,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
-    )
+# Transcripts longer than this get split into overlapping chunks processed in
+# parallel; a single 8K-token generation serializes the whole document
+LONG_TRANSCRIPT_THRESHOLD = 30_000
+TRANSCRIPT_CHUNK_SIZE = 20_000
+TRANSCRIPT_CHUNK_OVERLAP = 500
 
-    response_text = message.content[0].text
+CHUNK_PROMPT = """You are helping create educational Rust documentation from a YouTube video transcript. This is segment {part} of {total}; the other segments are being processed separately.
 
-    # Parse the response
-    lines = response_text.split('\n')
-    topic = None
-    title = None
-    is_rust = True
-    content_start = 0
-
-    for i, line in enumerate(lines):
-        if line.startswith('TOPIC:'):
-            topic = line.replace('TOPIC:', '').strip().lower()
-        elif line.startswith('TITLE:'):
-            title = line.replace('TITLE:', '').strip()
-        elif line.startswith('IS_RUST:'):
-            is_rust = 'yes' in line.lower()
-        elif '---CONTENT---' in line:
-            content_start = i + 1
+Rewrite this transcript segment into well-organized markdown:
+- Use clear headings and subheadings
+- Include code examples where mentioned
+- Fix any transcription errors or unclear passages
+- Keep the educational tone
+- Do not add an overall introduction or conclusion for the whole document
+
+Respond with only the markdown content.
+
+<transcript-segment>
+{chunk}
+</transcript-segment>"""
+
+STITCH_PROMPT = """The markdown below is the beginning of an educational document assembled from a YouTube video transcript.
+
+1. Determine if the content is about Rust programming.
+
+2. If it IS about Rust, identify the main topic. Choose from existing topics or suggest a new one:
+   - toolchain (rustup, rustc, cargo, build system)
+   - syntax-and-patterns (keywords, syntax, pattern matching)
+   - memory (ownership, borrowing, lifetimes, references)
+   - stdlib (standard library, collections, iterators)
+   - error-handling (Result, Option, error types)
+   - concurrency (threads, async, channels)
+   - unsafe (unsafe Rust, FFI, raw pointers)
+   - testing (unit tests, integration tests, benchmarks)
+   - Or suggest a new topic name (lowercase, hyphenated)
+
+3. Give the document a clear, concise title.
+
+Respond in this exact format:
+
+TOPIC: <topic-name>
+TITLE: <document-title>
+IS_RUST: <yes/no>
+
+<document-start>
+{excerpt}
+</document-start>"""
+
+
+def _parse_headers(text: str) -> tuple[str | None, str | None, bool]:
+    """Extract the TOPIC/TITLE/IS_RUST header fields from a response."""
+    topic_match = re.search(r'^TOPIC:\s*(.+)$', text, re.MULTILINE)
+    title_match = re.search(r'^TITLE:\s*(.+)$', text, re.MULTILINE)
+    rust_match = re.search(r'^IS_RUST:\s*(.+)$', text, re.MULTILINE)
+
+    topic = topic_match.group(1).strip().lower() if topic_match else None
+    title = title_match.group(1).strip() if title_match else None
+    is_rust = 'yes' in rust_match.group(1).lower() if rust_match else True
+    return topic, title, is_rust
+
+
+def _split_transcript(transcript: str) -> list[str]:
+    """Split a transcript into overlapping chunks near sentence boundaries."""
+    chunks = []
+    start = 0
+
+    while start < len(transcript):
+        end = min(start + TRANSCRIPT_CHUNK_SIZE, len(transcript))
+        if end < len(transcript):
+            # Prefer a sentence boundary in the back half of the chunk
+            cut = transcript.rfind('. ', start, end)
+            if cut > start + TRANSCRIPT_CHUNK_SIZE // 2:
+                end = cut + 1
+        chunks.append(transcript[start:end])
+        if end >= len(transcript):
             break
+        start = max(end - TRANSCRIPT_CHUNK_OVERLAP, start + 1)
+
+    return chunks
+
 
-    content = '\n'.join(lines[content_start:]).strip()
+def _process_long_transcript(transcript: str, client: anthropic.Anthropic) -> dict:
+    """Process a long transcript as parallel chunk generations plus a stitcher.
+
+    Each chunk becomes a markdown section generated concurrently, pipelining
+    inference across chunks instead of serializing one large generation.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    chunks = _split_transcript(transcript)
+    print(f"Long transcript: processing {len(chunks)} chunks in parallel...")
+
+    def summarize(args):
+        part, chunk = args
+        message = client.messages.create(
+            model=MODEL,
+            max_tokens=4096,
+            messages=[{
+                "role": "user",
+                "content": CHUNK_PROMPT.format(part=part, total=len(chunks), chunk=chunk),
+            }]
+        )
+        return message.content[0].text.strip()
+
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+        sections = list(executor.map(summarize, enumerate(chunks, 1)))
+
+    content = '\n\n'.join(sections)
+
+    # Small stitcher call decides topic/title/is_rust from the document start
+    message = client.messages.create(
+        model=MODEL,
+        max_tokens=200,
+        messages=[{
+            "role": "user",
+            "content": STITCH_PROMPT.format(excerpt=content[:4000]),
+        }]
+    )
+    topic, title, is_rust = _parse_headers(message.content[0].text)
 
     return {
         'topic': topic or 'misc',
@@ -159,6 +395,93 @@ IS_RUST: <yes/no>
     }
 
 
+def process_with_claude(transcript: str, client: anthropic.Anthropic,
+                        use_cache: bool = True) -> dict:
+    """Send transcript to Claude for processing."""
+    # Content-addressed cache: same model + prompt means the same response
+    cache_key = hashlib.sha256(
+        (MODEL + "\x00" + PROMPT_INSTRUCTIONS + "\x00" + transcript).encode()
+    ).hexdigest()
+    cache_path = CLAUDE_CACHE_DIR / f"{cache_key}.json"
+
+    if use_cache:
+        try:
+            cached = _json_loads(cache_path.read_text())
+            print("Claude response cache hit; skipping API call")
+            return cached
+        except (OSError, ValueError):
+            pass
+
+    if len(transcript) > LONG_TRANSCRIPT_THRESHOLD:
+        result = _process_long_transcript(transcript, client)
+        if use_cache:
+            CLAUDE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(_json_dumps(result))
+        return result
+
+    print("Processing transcript with Claude...")
+
+    # Stream the response so we start consuming tokens as they are generated
+    # instead of idling until the full message is ready
+    buf = io.StringIO()
+    received = 0
+    with client.messages.stream(
+        model=MODEL,
+        max_tokens=8192,
+        messages=[
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": PROMPT_INSTRUCTIONS,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {
+                        "type": "text",
+                        "text": f"<transcript>\n{transcript}\n</transcript>",
+                    },
+                ],
+            }
+        ]
+    ) as stream:
+        for text in stream.text_stream:
+            buf.write(text)
+            received += len(text)
+            if received >= 4096:
+                print(".", end="", flush=True)
+                received = 0
+    print()
+
+    response_text = buf.getvalue()
+
+    # Split once at the sentinel so only the small header region gets
+    # line-scanned, and the document body is never re-copied line by line
+    header, sep, content = response_text.partition('---CONTENT---')
+    if not sep:
+        content = response_text
+
+    topic, title, is_rust = _parse_headers(header)
+    content = content.strip()
+
+    result = {
+        'topic': topic or 'misc',
+        'title': title or 'Untitled',
+        'is_rust': is_rust,
+        'content': content
+    }
+
+    if use_cache:
+        CLAUDE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(_json_dumps(result))
+
+    return result
+
+
+# Collapses every run of non-word characters in a title into one hyphen
+_SLUG_RE = re.compile(r'[^\w]+')
+
+
 def save_document(result: dict, docs_dir: Path, video_id: str, existing_path: Path | None = None) -> Path:
     """Save the processed document to the appropriate folder."""
     topic = result['topic']
@@ -171,6 +494,7 @@ def save_document(result: dict, docs_dir: Path, video_id: str, existing_path: Pa
     # If overwriting, use existing path
     if existing_path:
         existing_path.write_text(content)
+        _record_video_path(video_id, existing_path)
         return existing_path
 
     # Create topic folder if needed
@@ -178,34 +502,87 @@ def save_document(result: dict, docs_dir: Path, video_id: str, existing_path: Pa
     topic_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate filename from title
-    filename = re.sub(r'[^\w\s-]', '', title.lower())
-    filename = re.sub(r'[-\s]+', '-', filename).strip('-')
-    filename = f"{filename}.md"
+    slug = _SLUG_RE.sub('-', title.lower()).strip('-')
 
-    filepath = topic_dir / filename
+    # Handle duplicates with one directory listing instead of stat-per-probe
+    existing = {p.stem for p in topic_dir.glob(f"{slug}*.md")}
+    if slug in existing:
+        counter = 1
+        while f"{slug}-{counter}" in existing:
+            counter += 1
+        slug = f"{slug}-{counter}"
 
-    # Handle duplicates
-    counter = 1
-    while filepath.exists():
-        filepath = topic_dir / f"{filename[:-3]}-{counter}.md"
-        counter += 1
+    filepath = topic_dir / f"{slug}.md"
 
     filepath.write_text(content)
+    _record_video_path(video_id, filepath)
     return filepath
 
 
+# Persistent title cache so nav regeneration only re-reads changed files
+NAV_STATE_PATH = CACHE_DIR / "nav_state.json"
+_TITLE_CACHE = None
+_TITLE_CACHE_DIRTY = False
+
+
+def _title_cache() -> dict:
+    """Load the path -> [mtime, title] cache on first use."""
+    global _TITLE_CACHE
+    if _TITLE_CACHE is None:
+        try:
+            _TITLE_CACHE = _json_loads(NAV_STATE_PATH.read_text())
+        except (OSError, ValueError):
+            _TITLE_CACHE = {}
+    return _TITLE_CACHE
+
+
+def _flush_title_cache():
+    """Persist the title cache if it picked up new entries."""
+    global _TITLE_CACHE_DIRTY
+    if _TITLE_CACHE_DIRTY and _TITLE_CACHE is not None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        NAV_STATE_PATH.write_text(_json_dumps(_TITLE_CACHE))
+        _TITLE_CACHE_DIRTY = False
+
+
 def get_doc_title(filepath: Path) -> str:
     """Extract title from markdown file (first H1 or filename)."""
+    global _TITLE_CACHE_DIRTY
+    cache = _title_cache()
+    key = str(filepath)
+
     try:
-        content = filepath.read_text()
-        # Look for first H1 heading
-        match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
+        mtime = filepath.stat().st_mtime
+    except OSError:
+        mtime = None
+
+    if mtime is not None:
+        entry = cache.get(key)
+        if entry and entry[0] == mtime:
+            return entry[1]
+
+    title = None
+    try:
+        # Read line-by-line and stop at the first H1 (usually line 1)
+        # instead of loading the whole file
+        with open(filepath, encoding='utf-8') as f:
+            for line in f:
+                match = re.match(r'#\s+(.+)', line)
+                if match:
+                    title = match.group(1).strip()
+                    break
     except Exception:
         pass
-    # Fallback to filename
-    return filepath.stem.replace('-', ' ').title()
+
+    if title is None:
+        # Fallback to filename
+        title = filepath.stem.replace('-', ' ').title()
+
+    if mtime is not None:
+        cache[key] = [mtime, title]
+        _TITLE_CACHE_DIRTY = True
+
+    return title
 
 
 def prettify_topic_name(topic: str) -> str:
@@ -246,6 +623,13 @@ def get_wrapper_name(src_file: Path) -> str:
 
 def generate_source_wrapper(src_file: Path) -> Path:
     """Generate a markdown wrapper for a source file with syntax highlighting."""
+    wrapper_path = src_file.parent / get_wrapper_name(src_file)
+
+    # Skip unchanged sources: rewriting identical wrappers churns the
+    # filesystem and triggers spurious mkdocs-serve reloads
+    if wrapper_path.exists() and wrapper_path.stat().st_mtime >= src_file.stat().st_mtime:
+        return wrapper_path
+
     lang = LANG_MAP.get(src_file.suffix, '')
     content = src_file.read_text()
 
@@ -255,7 +639,6 @@ def generate_source_wrapper(src_file: Path) -> Path:
 {content}
 ```
 """
-    wrapper_path = src_file.parent / get_wrapper_name(src_file)
     wrapper_path.write_text(md_content)
     return wrapper_path
 
@@ -264,72 +647,144 @@ def generate_source_wrapper(src_file: Path) -> Path:
 IGNORE_FOLDERS = {'repo', '__pycache__', '.git'}
 
 
-def build_lecture_series_nav(series_dir: Path, base_path: str) -> list:
+def _md_files(folder: Path) -> list[Path] | None:
+    """List markdown files in a folder via os.scandir, or None if missing."""
+    try:
+        with os.scandir(folder) as it:
+            return sorted(
+                Path(entry.path) for entry in it
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith('.md')
+            )
+    except FileNotFoundError:
+        return None
+
+
+def _scan_topic_folder(folder: Path) -> dict:
+    """Scan one topic folder in a single os.scandir pass."""
+    info = {'path': folder, 'mds': [], 'sources': [],
+            'has_readme': False, 'has_index': False}
+
+    with os.scandir(folder) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if entry.name == 'README.md':
+                info['has_readme'] = True
+            elif entry.name == 'index.md':
+                info['has_index'] = True
+            elif entry.name.endswith('-src.md'):
+                # Source file wrappers are regenerated, not listed directly
+                continue
+            elif entry.name.endswith('.md'):
+                info['mds'].append(Path(entry.path))
+            elif Path(entry.name).suffix in SOURCE_EXTENSIONS:
+                info['sources'].append(Path(entry.path))
+
+    return info
+
+
+def _scan_lectures(lectures_dir: Path) -> dict:
+    """Scan the lectures folder into {series_name: series_info}."""
+    series_map = {}
+
+    with os.scandir(lectures_dir) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if not entry.is_dir(follow_symlinks=False) or entry.name in IGNORE_FOLDERS:
+                continue
+            series = Path(entry.path)
+            lectures = _md_files(series / "lectures")
+            info = {
+                'path': series,
+                'has_index': (series / "index.md").exists(),
+                'has_lectures_dir': lectures is not None,
+                'lectures': lectures or [],
+                'companions': _md_files(series / "companions") or [],
+                'samples': [p for p in (_md_files(series / "samples") or [])
+                            if p.name != 'index.md'],
+            }
+            # Valid series: has index.md or a lectures/ subfolder
+            if info['has_index'] or info['has_lectures_dir']:
+                series_map[entry.name] = info
+
+    return series_map
+
+
+def scan_docs_tree(docs_dir: Path) -> dict:
+    """Walk docs/ once and return the structure both regenerators consume.
+
+    Returns {'top_level': [Path], 'folders': {name: info}, 'lectures': {...}}
+    where folder info comes from _scan_topic_folder and lectures from
+    _scan_lectures (empty dict when there is no lectures folder).
+    """
+    tree = {'top_level': [], 'folders': {}, 'lectures': {}}
+
+    if not docs_dir.exists():
+        return tree
+
+    with os.scandir(docs_dir) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if entry.name == 'index.md':
+                continue
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith('.md'):
+                tree['top_level'].append(Path(entry.path))
+            elif entry.is_dir(follow_symlinks=False) and entry.name not in IGNORE_FOLDERS:
+                if entry.name == 'lectures':
+                    tree['lectures'] = _scan_lectures(Path(entry.path))
+                else:
+                    tree['folders'][entry.name] = _scan_topic_folder(Path(entry.path))
+
+    return tree
+
+
+def build_lecture_series_nav(series_info: dict, base_path: str) -> list:
     """Build nav structure for a lecture series (e.g., docs/lectures/ripgrep/)."""
     items = []
 
     # Series index
-    index = series_dir / "index.md"
-    if index.exists():
+    if series_info['has_index']:
         items.append({'Overview': f"{base_path}/index.md"})
 
     # Lectures subfolder
-    lectures_dir = series_dir / "lectures"
-    if lectures_dir.exists():
-        lecture_items = []
-        for md_file in sorted(lectures_dir.glob("*.md")):
-            title = get_doc_title(md_file)
-            lecture_items.append({title: f"{base_path}/lectures/{md_file.name}"})
-        if lecture_items:
-            items.append({'Lectures': lecture_items})
+    lecture_items = []
+    for md_file in series_info['lectures']:
+        title = get_doc_title(md_file)
+        lecture_items.append({title: f"{base_path}/lectures/{md_file.name}"})
+    if lecture_items:
+        items.append({'Lectures': lecture_items})
 
     # Companions subfolder
-    companions_dir = series_dir / "companions"
-    if companions_dir.exists():
-        companion_items = []
-        for md_file in sorted(companions_dir.glob("*.md")):
-            title = get_doc_title(md_file)
-            companion_items.append({title: f"{base_path}/companions/{md_file.name}"})
-        if companion_items:
-            items.append({'Companions': companion_items})
-
-    # Samples subfolder (if exists)
-    samples_dir = series_dir / "samples"
-    if samples_dir.exists():
-        sample_items = []
-        for md_file in sorted(samples_dir.glob("*.md")):
-            if md_file.name == 'index.md':
-                continue
-            title = get_doc_title(md_file)
-            sample_items.append({title: f"{base_path}/samples/{md_file.name}"})
-        if sample_items:
-            items.append({'Samples': sample_items})
+    companion_items = []
+    for md_file in series_info['companions']:
+        title = get_doc_title(md_file)
+        companion_items.append({title: f"{base_path}/companions/{md_file.name}"})
+    if companion_items:
+        items.append({'Companions': companion_items})
+
+    # Samples subfolder
+    sample_items = []
+    for md_file in series_info['samples']:
+        title = get_doc_title(md_file)
+        sample_items.append({title: f"{base_path}/samples/{md_file.name}"})
+    if sample_items:
+        items.append({'Samples': sample_items})
 
     return items
 
 
-def build_lectures_nav(lectures_dir: Path) -> dict:
+def build_lectures_nav(lectures: dict) -> dict | None:
     """Build nav structure for the entire lectures folder."""
     lecture_series = []
 
-    for series in sorted(lectures_dir.iterdir()):
-        if not series.is_dir() or series.name in IGNORE_FOLDERS:
-            continue
-
-        # Check if this is a valid lecture series (has index.md or lectures/ subfolder)
-        has_index = (series / "index.md").exists()
-        has_lectures = (series / "lectures").exists()
-
-        if has_index or has_lectures:
-            series_name = prettify_topic_name(series.name)
-            series_items = build_lecture_series_nav(series, f"lectures/{series.name}")
-            if series_items:
-                lecture_series.append({series_name: series_items})
+    for name, series_info in lectures.items():
+        series_name = prettify_topic_name(name)
+        series_items = build_lecture_series_nav(series_info, f"lectures/{name}")
+        if series_items:
+            lecture_series.append({series_name: series_items})
 
     return {'Lectures': lecture_series} if lecture_series else None
 
 
-def regenerate_mkdocs_nav(docs_dir: Path, project_root: Path):
+def regenerate_mkdocs_nav(docs_dir: Path, project_root: Path, tree: dict | None = None):
     """Regenerate mkdocs.yml nav section based on docs directory structure."""
     print("Regenerating mkdocs.yml navigation...")
 
@@ -338,9 +793,14 @@ def regenerate_mkdocs_nav(docs_dir: Path, project_root: Path):
         print("Warning: mkdocs.yml not found")
         return
 
+    if tree is None:
+        tree = scan_docs_tree(docs_dir)
+
+    yaml, yaml_loader, yaml_dumper = _load_yaml()
+
     # Read current mkdocs.yml
     with open(mkdocs_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=yaml_loader)
 
     # Build new nav structure
     nav = []
@@ -348,62 +808,46 @@ def regenerate_mkdocs_nav(docs_dir: Path, project_root: Path):
     # Always start with Home
     nav.append({'Home': 'index.md'})
 
-    # Collect top-level docs (non-index)
-    top_level = []
-    folders = []
-
-    for item in sorted(docs_dir.iterdir()):
-        if item.name == 'index.md':
-            continue
-        if item.is_file() and item.suffix == '.md':
-            title = get_doc_title(item)
-            top_level.append((title, item.name))
-        elif item.is_dir() and item.name not in IGNORE_FOLDERS:
-            folders.append(item)
-
     # Add top-level docs
-    for title, filename in top_level:
-        nav.append({title: filename})
+    for item in tree['top_level']:
+        nav.append({get_doc_title(item): item.name})
+
+    # Add folder sections (lectures slot in alphabetically with the rest)
+    section_names = sorted(tree['folders'])
+    if tree['lectures']:
+        section_names = sorted(section_names + ['lectures'])
 
-    # Add folder sections
-    for folder in sorted(folders):
+    for name in section_names:
         # Special handling for lectures
-        if folder.name == 'lectures':
-            lectures_nav = build_lectures_nav(folder)
+        if name == 'lectures':
+            lectures_nav = build_lectures_nav(tree['lectures'])
             if lectures_nav:
                 nav.append(lectures_nav)
             continue
-        section_name = prettify_topic_name(folder.name)
+
+        info = tree['folders'][name]
+        section_name = prettify_topic_name(name)
         section_items = []
 
         # Check for README or index first
-        readme = folder / "README.md"
-        index = folder / "index.md"
-
-        if readme.exists():
-            section_items.append({'Overview': f"{folder.name}/README.md"})
-        elif index.exists():
-            section_items.append({'Overview': f"{folder.name}/index.md"})
+        if info['has_readme']:
+            section_items.append({'Overview': f"{name}/README.md"})
+        elif info['has_index']:
+            section_items.append({'Overview': f"{name}/index.md"})
 
-        # Add other markdown files (exclude source wrappers like foo-src.md)
-        for md_file in sorted(folder.glob("*.md")):
-            if md_file.name in ('README.md', 'index.md'):
-                continue
-            # Skip source file wrappers (e.g., foo-src.md)
-            if md_file.name.endswith('-src.md'):
-                continue
+        # Add other markdown files (source wrappers already excluded by the scan)
+        for md_file in info['mds']:
             title = get_doc_title(md_file)
-            section_items.append({title: f"{folder.name}/{md_file.name}"})
+            section_items.append({title: f"{name}/{md_file.name}"})
 
         # Add source files (generate markdown wrappers)
         source_files = []
-        for src_file in sorted(folder.iterdir()):
-            if src_file.is_file() and src_file.suffix in SOURCE_EXTENSIONS:
-                # Generate markdown wrapper
-                wrapper_path = generate_source_wrapper(src_file)
-                title = get_source_title(src_file)
-                # Link to the markdown wrapper (readable with syntax highlighting)
-                source_files.append({title: f"{folder.name}/{wrapper_path.name}"})
+        for src_file in info['sources']:
+            # Generate markdown wrapper
+            wrapper_path = generate_source_wrapper(src_file)
+            title = get_source_title(src_file)
+            # Link to the markdown wrapper (readable with syntax highlighting)
+            source_files.append({title: f"{name}/{wrapper_path.name}"})
 
         if source_files:
             section_items.append({'Source Files': source_files})
@@ -411,6 +855,13 @@ def regenerate_mkdocs_nav(docs_dir: Path, project_root: Path):
         if section_items:
             nav.append({section_name: section_items})
 
+    # Short-circuit when nothing changed: rewriting an identical file only
+    # creates git noise and mkdocs-serve reloads
+    if config.get('nav') == nav and 'exclude_docs' in config:
+        _flush_title_cache()
+        print("mkdocs.yml navigation unchanged")
+        return
+
     # Update config
     config['nav'] = nav
 
@@ -418,67 +869,61 @@ def regenerate_mkdocs_nav(docs_dir: Path, project_root: Path):
     if 'exclude_docs' not in config:
         config['exclude_docs'] = "**/repo/**\n**/__pycache__/**"
 
-    # Write back
-    with open(mkdocs_path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    # Write back only if the serialized bytes actually differ
+    new_yaml = yaml.dump(config, Dumper=yaml_dumper, default_flow_style=False,
+                         sort_keys=False, allow_unicode=True).encode('utf-8')
+
+    _flush_title_cache()
+
+    try:
+        if mkdocs_path.read_bytes() == new_yaml:
+            print("mkdocs.yml unchanged")
+            return
+    except OSError:
+        pass
 
+    mkdocs_path.write_bytes(new_yaml)
     print(f"Updated mkdocs.yml with {len(nav)} nav entries")
 
 
-def regenerate_index(docs_dir: Path):
+def regenerate_index(docs_dir: Path, tree: dict | None = None):
     """Regenerate docs/index.md based on current documentation structure."""
     print("Regenerating index.md...")
 
     index_path = docs_dir / "index.md"
 
+    if tree is None:
+        tree = scan_docs_tree(docs_dir)
+
     # Collect structure
-    top_level = []
+    top_level = [(get_doc_title(item), item.name) for item in tree['top_level']]
     sections = {}  # section_name -> {'docs': [...], 'sources': [...]}
     lecture_series = []  # list of (series_name, index_path, lecture_count)
 
-    for item in sorted(docs_dir.iterdir()):
-        if item.name == 'index.md':
-            continue
-        if item.is_file() and item.suffix == '.md':
-            title = get_doc_title(item)
-            top_level.append((title, item.name))
-        elif item.is_dir() and item.name not in IGNORE_FOLDERS:
-            # Special handling for lectures
-            if item.name == 'lectures':
-                for series in sorted(item.iterdir()):
-                    if not series.is_dir() or series.name in IGNORE_FOLDERS:
-                        continue
-                    series_index = series / "index.md"
-                    lectures_subdir = series / "lectures"
-                    if series_index.exists() or lectures_subdir.exists():
-                        series_name = prettify_topic_name(series.name)
-                        lecture_count = len(list(lectures_subdir.glob("*.md"))) if lectures_subdir.exists() else 0
-                        index_link = f"lectures/{series.name}/index.md" if series_index.exists() else None
-                        lecture_series.append((series_name, index_link, lecture_count))
-                continue
+    for name, series_info in tree['lectures'].items():
+        series_name = prettify_topic_name(name)
+        lecture_count = len(series_info['lectures'])
+        index_link = f"lectures/{name}/index.md" if series_info['has_index'] else None
+        lecture_series.append((series_name, index_link, lecture_count))
+
+    for name in sorted(tree['folders']):
+        info = tree['folders'][name]
+        section_name = prettify_topic_name(name)
+        docs = []
+        sources = []
+
+        for md_file in info['mds']:
+            title = get_doc_title(md_file)
+            docs.append((title, f"{name}/{md_file.name}"))
+
+        for src_file in info['sources']:
+            # src = raw file, doc = markdown wrapper (foo-src.md)
+            src_path = f"{name}/{src_file.name}"
+            doc_path = f"{name}/{get_wrapper_name(src_file)}"
+            sources.append((src_file.name, src_path, doc_path))
 
-            section_name = prettify_topic_name(item.name)
-            docs = []
-            sources = []
-
-            for md_file in sorted(item.glob("*.md")):
-                if md_file.name in ('README.md', 'index.md'):
-                    continue
-                # Skip source file wrappers (e.g., foo-src.md)
-                if md_file.name.endswith('-src.md'):
-                    continue
-                title = get_doc_title(md_file)
-                docs.append((title, f"{item.name}/{md_file.name}"))
-
-            for src_file in sorted(item.iterdir()):
-                if src_file.is_file() and src_file.suffix in SOURCE_EXTENSIONS:
-                    # src = raw file, doc = markdown wrapper (foo-src.md)
-                    src_path = f"{item.name}/{src_file.name}"
-                    doc_path = f"{item.name}/{get_wrapper_name(src_file)}"
-                    sources.append((src_file.name, src_path, doc_path))
-
-            if docs or sources:
-                sections[section_name] = {'docs': docs, 'sources': sources}
+        if docs or sources:
+            sections[section_name] = {'docs': docs, 'sources': sources}
 
     # Generate markdown
     lines = [
@@ -535,7 +980,19 @@ def regenerate_index(docs_dir: Path):
         "",
     ])
 
-    index_path.write_text('\n'.join(lines))
+    new_index = '\n'.join(lines).encode('utf-8')
+
+    _flush_title_cache()
+
+    # Skip the write (and the mkdocs-serve reload it triggers) when identical
+    try:
+        if index_path.read_bytes() == new_index:
+            print("index.md unchanged")
+            return
+    except OSError:
+        pass
+
+    index_path.write_bytes(new_index)
     print(f"Updated index.md")
 
 
@@ -547,11 +1004,13 @@ def git_commit_and_push(filepath: Path, title: str, video_id: str, project_root:
         # Get relative path for cleaner commit message
         rel_path = filepath.relative_to(project_root)
 
-        # Git add - include the doc, mkdocs.yml, and index.md
+        # Git add - include the doc, mkdocs.yml, and index.md.
+        # Discard stdout instead of buffering output we never read.
         subprocess.run(
             ["git", "add", str(filepath), "mkdocs.yml", "docs/index.md"],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             cwd=project_root
         )
 
@@ -560,16 +1019,181 @@ def git_commit_and_push(filepath: Path, title: str, video_id: str, project_root:
         subprocess.run(
             ["git", "commit", "-m", commit_msg],
             check=True,
-            capture_output=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            cwd=project_root
         )
         print(f"Committed: {rel_path}")
 
-        # Git push
-        result = subprocess.run(
+        # Git push is the slow step: stream its progress (git writes it to
+        # stderr) live instead of holding it until the process exits
+        proc = subprocess.Popen(
+            ["git", "push"],
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=project_root
+        )
+        for line in proc.stderr:
+            print(line, end='')
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, ["git", "push"])
+        print("Pushed to remote.")
+
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode()
+        print(f"Git error: {stderr if stderr else e}")
+        raise
+
+
+# Concurrent fetch/process workers for --batch mode (the work is I/O-bound)
+BATCH_WORKERS = 8
+
+
+def process_one(url: str, client, docs_dir: Path,
+                overwrite: bool = False, use_cache: bool = True,
+                interactive: bool = True) -> tuple[Path, dict, str] | None:
+    """Process a single URL end-to-end: fetch, Claude, save.
+
+    Returns (filepath, result, video_id), or None if the video was skipped.
+    """
+    video_id = extract_video_id(url)
+    print(f"Video ID: {video_id}")
+
+    # Check for existing document
+    existing_doc = find_existing_document(video_id, docs_dir)
+    if existing_doc and not overwrite:
+        print(f"\nError: This video has already been processed.")
+        print(f"Existing document: {existing_doc}")
+        print("\nUse --overwrite to replace the existing document.")
+        if not interactive:
+            return None
+        sys.exit(1)
+    elif existing_doc:
+        print(f"Will overwrite existing document: {existing_doc}")
+
+    # Fetch transcript
+    transcript = fetch_transcript(video_id, use_cache=use_cache)
+    print(f"Transcript length: {len(transcript)} characters")
+
+    if len(transcript) < 100:
+        print("Warning: Transcript seems very short. Video may not have captions.")
+
+    # Process with Claude
+    result = process_with_claude(transcript, client, use_cache=use_cache)
+
+    if not result['is_rust']:
+        print("\nWarning: This video doesn't appear to be about Rust programming.")
+        if not interactive:
+            print(f"Skipping: {url}")
+            return None
+        response = input("Continue anyway? (y/n): ")
+        if response.lower() != 'y':
+            print("Aborted.")
+            sys.exit(0)
+
+    # Save document
+    filepath = save_document(result, docs_dir, video_id, existing_doc)
+
+    print(f"\nSuccess!")
+    print(f"Topic: {result['topic']}")
+    print(f"Title: {result['title']}")
+    print(f"Saved to: {filepath}")
+
+    return filepath, result, video_id
+
+
+def process_batch(urls: list[str], client, docs_dir: Path,
+                  overwrite: bool, use_cache: bool) -> list[tuple[Path, dict, str]]:
+    """Process many URLs concurrently, bounded by BATCH_WORKERS."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    saved = []
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+        futures = {
+            executor.submit(process_one, url, client, docs_dir,
+                            overwrite, use_cache, False): url
+            for url in urls
+        }
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                outcome = future.result()
+                if outcome:
+                    saved.append(outcome)
+            except Exception as e:
+                print(f"Error processing {url}: {e}")
+                failed.append(url)
+
+    if failed:
+        print(f"\n{len(failed)} URL(s) failed:")
+        for url in failed:
+            print(f"  - {url}")
+
+    return saved
+
+
+def regenerate_all(docs_dir: Path, project_root: Path, tree: dict | None = None):
+    """Regenerate mkdocs.yml and index.md from one shared tree, in parallel.
+
+    Both regenerators are I/O-bound and independent once the tree is built,
+    so their writes overlap in two worker threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if tree is None:
+        tree = scan_docs_tree(docs_dir)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        nav_future = executor.submit(regenerate_mkdocs_nav, docs_dir, project_root, tree)
+        index_future = executor.submit(regenerate_index, docs_dir, tree)
+        nav_future.result()
+        index_future.result()
+
+
+def git_commit_and_push_batch(saved: list[tuple[Path, dict, str]], project_root: Path):
+    """Git add, commit, and push a whole batch of documents at once.
+
+    One add/commit/push round instead of three subprocesses and a remote
+    round-trip per document.
+    """
+    print("\nCommitting batch to git...")
+
+    # Skip optional lock/index refresh work; we only add explicit paths
+    env = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+    try:
+        paths = [str(filepath) for filepath, _, _ in saved]
+        subprocess.run(
+            ["git", "add", *paths, "mkdocs.yml", "docs/index.md"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            cwd=project_root,
+            env=env,
+        )
+
+        summary = [f"Add {len(saved)} transcripts", ""]
+        for _, result, video_id in saved:
+            summary.append(f"- {result['title']} (https://youtu.be/{video_id})")
+
+        subprocess.run(
+            ["git", "commit", "-m", "\n".join(summary)],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            cwd=project_root,
+            env=env,
+        )
+        print(f"Committed {len(saved)} documents.")
+
+        subprocess.run(
             ["git", "push"],
             check=True,
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            cwd=project_root,
+            env=env,
         )
         print("Pushed to remote.")
 
@@ -581,18 +1205,35 @@ def git_commit_and_push(filepath: Path, title: str, video_id: str, project_root:
 def main():
     # Parse arguments
     args = sys.argv[1:]
+
+    if '--help' in args or '-h' in args:
+        print(__doc__.strip())
+        sys.exit(0)
+
     push_flag = '--push' in args
     overwrite_flag = '--overwrite' in args
-    args = [a for a in args if a not in ('--push', '--overwrite')]
+    no_cache_flag = '--no-cache' in args
+    args = [a for a in args if a not in ('--push', '--overwrite', '--no-cache')]
+
+    batch_file = None
+    if '--batch' in args:
+        batch_idx = args.index('--batch')
+        if batch_idx + 1 >= len(args):
+            print("Error: --batch requires a file of URLs (one per line)")
+            sys.exit(1)
+        batch_file = Path(args[batch_idx + 1])
+        del args[batch_idx:batch_idx + 2]
 
-    if len(args) < 1:
-        print("Usage: python process_transcript.py <youtube_url> [--push] [--overwrite]")
+    if batch_file is None and len(args) < 1:
+        print("Usage: python process_transcript.py <youtube_url> [--push] [--overwrite] [--no-cache]")
+        print("       python process_transcript.py --batch <urls.txt> [--push] [--overwrite] [--no-cache]")
         print("Example: python process_transcript.py 'https://youtu.be/QQzAWxYKPSE' --push")
         sys.exit(1)
 
-    url = args[0]
-
     # Load environment
+    from dotenv import load_dotenv
+    import anthropic
+
     load_dotenv()
     api_key = os.getenv('ANTHROPIC_API_KEY')
     if not api_key:
@@ -606,50 +1247,53 @@ def main():
     project_root = Path(__file__).parent
     docs_dir = project_root / "docs"
 
-    try:
-        # Extract video ID
-        video_id = extract_video_id(url)
-        print(f"Video ID: {video_id}")
-
-        # Check for existing document
-        existing_doc = find_existing_document(video_id, docs_dir)
-        if existing_doc and not overwrite_flag:
-            print(f"\nError: This video has already been processed.")
-            print(f"Existing document: {existing_doc}")
-            print("\nUse --overwrite to replace the existing document.")
-            sys.exit(1)
-        elif existing_doc:
-            print(f"Will overwrite existing document: {existing_doc}")
-
-        # Fetch transcript
-        transcript = fetch_transcript(video_id)
-        print(f"Transcript length: {len(transcript)} characters")
-
-        if len(transcript) < 100:
-            print("Warning: Transcript seems very short. Video may not have captions.")
-
-        # Process with Claude
-        client = anthropic.Anthropic(api_key=api_key)
-        result = process_with_claude(transcript, client)
+    client = anthropic.Anthropic(api_key=api_key)
+    use_cache = not no_cache_flag
 
-        if not result['is_rust']:
-            print("\nWarning: This video doesn't appear to be about Rust programming.")
-            response = input("Continue anyway? (y/n): ")
-            if response.lower() != 'y':
-                print("Aborted.")
-                sys.exit(0)
-
-        # Save document
-        filepath = save_document(result, docs_dir, video_id, existing_doc)
-
-        print(f"\nSuccess!")
-        print(f"Topic: {result['topic']}")
-        print(f"Title: {result['title']}")
-        print(f"Saved to: {filepath}")
+    try:
+        if batch_file is not None:
+            if not batch_file.exists():
+                print(f"Error: Batch file not found: {batch_file}")
+                sys.exit(1)
+
+            urls = [line.strip() for line in batch_file.read_text().splitlines()
+                    if line.strip() and not line.strip().startswith('#')]
+            print(f"Processing {len(urls)} URL(s) from {batch_file}")
+
+            saved = process_batch(urls, client, docs_dir, overwrite_flag, use_cache)
+            if not saved:
+                print("\nNo documents saved.")
+                return
+
+            # Regenerate once for the whole batch, not per URL
+            regenerate_all(docs_dir, project_root)
+
+            if auto_push:
+                git_commit_and_push_batch(saved, project_root)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Pre-scan docs/ while the network + Claude round-trip is in flight
+            tree_future = executor.submit(scan_docs_tree, docs_dir)
+            outcome = process_one(args[0], client, docs_dir, overwrite_flag, use_cache)
+            if outcome is None:
+                tree_future.cancel()
+                return
+            filepath, result, video_id = outcome
+            tree = tree_future.result()
+
+        # Patch the pre-scanned tree with the folder the new doc landed in
+        topic_dir = filepath.parent
+        if topic_dir.parent == docs_dir and topic_dir.name != 'lectures':
+            tree['folders'][topic_dir.name] = _scan_topic_folder(topic_dir)
+        else:
+            # Saved somewhere unusual (e.g. under lectures/): rescan fully
+            tree = scan_docs_tree(docs_dir)
 
         # Regenerate mkdocs.yml and index.md
-        regenerate_mkdocs_nav(docs_dir, project_root)
-        regenerate_index(docs_dir)
+        regenerate_all(docs_dir, project_root, tree)
 
         # Git commit and push if enabled
         if auto_push:
@@ -19,8 +19,12 @@ Delete mode:
 
 import sys
 import os
+import json
 import re
+import shlex
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 import anthropic
@@ -33,12 +37,20 @@ from process_transcript import (
 )
 
 
-def git_pull(project_root: Path) -> tuple[bool, list[str]]:
-    """Execute git pull and return (had_changes, deleted_files)."""
+def git_pull(project_root: Path) -> tuple[bool, list[str], str]:
+    """Execute git pull and return (had_changes, deleted_files, old_head)."""
     print("Pulling latest changes...")
 
-    # Get list of files before pull
     try:
+        # Record HEAD before the pull so deletions can be diffed precisely
+        old_head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=project_root
+        ).stdout.strip()
+
         result = subprocess.run(
             ["git", "pull"],
             check=True,
@@ -49,22 +61,60 @@ def git_pull(project_root: Path) -> tuple[bool, list[str]]:
         output = result.stdout.strip()
         print(output if output else "Already up to date.")
 
-        # Parse deleted files from pull output
-        # Lines like: "delete mode 100644 docs/some-file.md"
-        deleted = []
-        for line in output.split('\n'):
-            if 'delete mode' in line and 'docs/' in line:
-                # Extract the file path
-                parts = line.split()
-                if len(parts) >= 4:
-                    deleted.append(parts[-1])
-
+        # A quick substring test on the pull output decides whether the
+        # deletion diff is worth running at all
         had_changes = "Already up to date" not in output
-        return had_changes, deleted
+        if not had_changes:
+            return False, [], old_head
+
+        # Ask git exactly which docs the pull deleted instead of scraping
+        # "delete mode" lines out of the pull output
+        diff = subprocess.run(
+            ["git", "diff", "--name-only", "--diff-filter=D", "-z",
+             f"{old_head}..HEAD", "--", "docs/"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=project_root
+        ).stdout
+        deleted = [path for path in diff.split('\0') if path]
+
+        return had_changes, deleted, old_head
 
     except subprocess.CalledProcessError as e:
         print(f"Git pull failed: {e.stderr}")
-        return False, []
+        return False, [], ''
+
+
+def _deleted_doc_titles(project_root: Path, rev: str, paths: list[str]) -> dict[str, str]:
+    """Read the H1 titles of deleted docs at ``rev`` in one git process.
+
+    A single ``git cat-file --batch`` child serves every blob request over
+    its stdin/stdout pipe instead of forking one ``git show`` per file.
+    """
+    titles = {}
+    proc = subprocess.Popen(
+        ["git", "cat-file", "--batch"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        cwd=project_root,
+    )
+    try:
+        for path in paths:
+            proc.stdin.write(f"{rev}:{path}\n".encode())
+            proc.stdin.flush()
+            header = proc.stdout.readline().split()
+            if len(header) != 3 or header[1] != b'blob':
+                continue
+            size = int(header[2])
+            blob = proc.stdout.read(size + 1)[:size]  # +1 eats the trailing newline
+            first_line = blob.partition(b'\n')[0].decode('utf-8', errors='replace')
+            if first_line.startswith('# '):
+                titles[path] = first_line[2:].strip()
+    finally:
+        proc.stdin.close()
+        proc.wait()
+    return titles
 
 
 def delete_doc(filepath: Path, docs_dir: Path, project_root: Path, auto_push: bool):
@@ -83,12 +133,16 @@ def delete_doc(filepath: Path, docs_dir: Path, project_root: Path, auto_push: bo
     # Remove the file
     filepath.unlink()
 
-    # Check if parent folder is now empty (except for README/index)
+    # Check if parent folder is now empty (except for README/index),
+    # short-circuiting on the first real entry instead of listing them all
     parent = filepath.parent
     if parent != docs_dir:
-        remaining = [f for f in parent.iterdir()
-                     if f.name not in ('README.md', 'index.md', '.DS_Store')]
-        if not remaining:
+        with os.scandir(parent) as it:
+            has_content = any(
+                entry.name not in ('README.md', 'index.md', '.DS_Store')
+                for entry in it
+            )
+        if not has_content:
             # Remove README/index if present
             for special in ('README.md', 'index.md'):
                 special_path = parent / special
@@ -102,30 +156,57 @@ def delete_doc(filepath: Path, docs_dir: Path, project_root: Path, auto_push: bo
     regenerate_mkdocs_nav(docs_dir, project_root)
     regenerate_index(docs_dir)
 
-    # Git commit if enabled
+    # Git commit if enabled - one shell invocation instead of three spawns
     if auto_push:
-        try:
-            subprocess.run(
-                ["git", "add", "-A", "docs/", "mkdocs.yml"],
-                check=True,
-                capture_output=True,
-                cwd=project_root
-            )
-            subprocess.run(
-                ["git", "commit", "-m", f"Remove doc: {rel_path.name}"],
-                check=True,
-                capture_output=True,
-                cwd=project_root
-            )
-            subprocess.run(
-                ["git", "push"],
-                check=True,
-                capture_output=True,
-                cwd=project_root
-            )
+        commit_msg = f"Remove doc: {rel_path.name}"
+        cmd = (
+            "git add -A docs/ mkdocs.yml && "
+            f"git commit -m {shlex.quote(commit_msg)} && git push"
+        )
+        result = subprocess.run(
+            cmd,
+            shell=True,
+            executable="/bin/bash",
+            capture_output=True,
+            text=True,
+            cwd=project_root
+        )
+        if result.returncode != 0:
+            print(f"Git error: {result.stderr}")
+        else:
             print("Committed and pushed.")
-        except subprocess.CalledProcessError as e:
-            print(f"Git error: {e.stderr.decode() if e.stderr else e}")
+
+
+# Environment is read once at import; every later lookup is a plain
+# module-attribute access instead of a dotenv parse + os.environ probe
+load_dotenv()
+API_KEY = os.getenv('ANTHROPIC_API_KEY')
+AUTO_PUSH_ENV = os.getenv('AUTO_PUSH', '').lower() in ('true', '1', 'yes')
+
+# Metadata markers meaning a file was already processed. One compiled
+# pattern matches either marker in a single scan of each probed region
+_SYNC_MARKER = b"<!-- ProcessedBy: sync_docs -->"
+_MARKER_RE = re.compile(rb"<!-- (?:VideoId|ProcessedBy):")
+
+
+def _has_metadata_marker(md_file: Path) -> bool:
+    """Check for processing markers without reading the whole file.
+
+    The markers live near the top or (usually) the very bottom, so probing
+    the first and last 4KB in binary mode is enough.
+    """
+    with open(md_file, 'rb') as f:
+        head = f.read(4096)
+        if _MARKER_RE.search(head):
+            return True
+
+        size = f.seek(0, os.SEEK_END)
+        if size <= 4096:
+            return False
+
+        # Overlap the regions slightly so a straddling marker isn't missed
+        f.seek(max(4096 - len(_SYNC_MARKER), size - 4096))
+        return _MARKER_RE.search(f.read()) is not None
 
 
 def find_uncategorized_docs(docs_dir: Path) -> list[Path]:
@@ -135,42 +216,28 @@ def find_uncategorized_docs(docs_dir: Path) -> list[Path]:
     # Files to skip (special files that should stay at root)
     skip_files = {'index.md', 'README.md'}
 
-    for md_file in docs_dir.glob("*.md"):
-        if md_file.name in skip_files:
-            continue
+    # os.scandir avoids the per-entry stat and Path construction of glob
+    with os.scandir(docs_dir) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if not entry.name.endswith('.md') or entry.name in skip_files:
+                continue
 
-        # Check if file has VideoId metadata (already processed)
-        content = md_file.read_text()
-        if "<!-- VideoId:" in content:
-            continue
+            md_file = Path(entry.path)
 
-        # Check if file has ProcessedBy metadata (already processed by this script)
-        if "<!-- ProcessedBy: sync_docs -->" in content:
-            continue
+            # Skip files already processed (VideoId or sync_docs marker)
+            if _has_metadata_marker(md_file):
+                continue
 
-        uncategorized.append(md_file)
+            uncategorized.append(md_file)
 
     return uncategorized
 
 
-def categorize_with_claude(filepath: Path, client: anthropic.Anthropic) -> dict:
-    """Use Claude to determine topic and title for a markdown file."""
-    print(f"Analyzing: {filepath.name}")
-
-    content = filepath.read_text()
-
-    # Truncate if too long
-    if len(content) > 50000:
-        content = content[:50000] + "\n\n[Content truncated...]"
-
-    prompt = f"""Analyze this Rust-related markdown document and categorize it.
-
-<document>
-{content}
-</document>
-
-Determine:
-1. The main topic category. Choose from existing topics or suggest a new one:
+# Shared topic taxonomy and per-document output spec. Static across calls,
+# so it is sent as a system block marked for Anthropic's prompt cache.
+_TOPIC_TAXONOMY = """1. The main topic category. Choose from existing topics or suggest a new one:
    - toolchain (rustup, rustc, cargo, build system)
    - syntax-and-patterns (keywords, syntax, pattern matching)
    - memory (ownership, borrowing, lifetimes, references)
@@ -184,7 +251,12 @@ Determine:
 
 2. A clear, concise title for the document (if the existing H1 is good, keep it)
 
-3. A suggested filename (lowercase, hyphenated, .md extension)
+3. A suggested filename (lowercase, hyphenated, .md extension)"""
+
+STATIC_INSTRUCTIONS = f"""Analyze the Rust-related markdown document provided by the user and categorize it.
+
+Determine:
+{_TOPIC_TAXONOMY}
 
 Respond in this exact format:
 TOPIC: <topic-name>
@@ -192,11 +264,77 @@ TITLE: <document-title>
 FILENAME: <suggested-filename.md>
 """
 
+
+# Categorization is a short classification task, so it runs on the cheaper,
+# faster Haiku model; the Sonnet fallback only fires when Haiku punts
+CATEGORIZE_MODEL = "claude-3-5-haiku-20241022"
+FALLBACK_MODEL = "claude-sonnet-4-20250514"
+
+
+def _anthropic_client(api_key: str) -> anthropic.Anthropic:
+    """Build the API client on a pooled httpx transport.
+
+    Concurrent batch workers then reuse keep-alive connections instead of
+    paying a TLS handshake per request. HTTP/2 multiplexing is enabled when
+    the optional h2 package is installed.
+    """
+    import httpx  # anthropic already depends on it
+
+    limits = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+    try:
+        http_client = httpx.Client(http2=True, limits=limits, timeout=60)
+    except ImportError:
+        http_client = httpx.Client(limits=limits, timeout=60)
+    return anthropic.Anthropic(api_key=api_key, http_client=http_client)
+
+
+# Serializes stdout writes from concurrent categorization workers
+_PRINT_LOCK = threading.Lock()
+
+
+def _emit(lines: list[str]):
+    """Write a block of output lines with a single, lock-guarded write."""
+    with _PRINT_LOCK:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _log_cache_usage(message):
+    """Report prompt-cache hits so cache effectiveness is visible."""
+    usage = getattr(message, 'usage', None)
+    cached = getattr(usage, 'cache_read_input_tokens', None)
+    if cached:
+        _emit([f"  (prompt cache: {cached} tokens reused)"])
+
+
+def categorize_with_claude(filepath: Path, client: anthropic.Anthropic,
+                           model: str = CATEGORIZE_MODEL) -> dict:
+    """Use Claude to determine topic and title for a markdown file."""
+    print(f"Analyzing: {filepath.name}")
+
+    # Read at most the prompt budget instead of slurping the whole file
+    # only to slice it; the stat tells us whether anything was cut off
+    size = filepath.stat().st_size
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read(50000)
+    if size > 50000:
+        content += "\n\n[Content truncated...]"
+
+    # The static instructions go in a cached system block; only the document
+    # itself is fresh input tokens
+    # Three short header lines never need more than ~120 tokens, and the
+    # stop sequence cuts the response off if the model starts elaborating
     message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=500,
-        messages=[{"role": "user", "content": prompt}]
+        model=model,
+        max_tokens=120,
+        stop_sequences=["\n\n\n"],
+        system=[{
+            "type": "text",
+            "text": STATIC_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"},
+        }],
+        messages=[{"role": "user", "content": f"<document>\n{content}\n</document>"}]
     )
+    _log_cache_usage(message)
 
     response_text = message.content[0].text
 
@@ -213,6 +351,13 @@ FILENAME: <suggested-filename.md>
         elif line.startswith('FILENAME:'):
             filename = line.replace('FILENAME:', '').strip()
 
+    # Escalate to the stronger model when the cheap one punts: a 'misc'
+    # topic or a missing field is worth one more (pricier) round-trip
+    if model == CATEGORIZE_MODEL and (
+            topic in (None, 'misc') or title is None or filename is None):
+        print(f"  Weak result from {CATEGORIZE_MODEL}; retrying with {FALLBACK_MODEL}")
+        return categorize_with_claude(filepath, client, model=FALLBACK_MODEL)
+
     return {
         'topic': topic or 'misc',
         'title': title or filepath.stem.replace('-', ' ').title(),
@@ -220,30 +365,115 @@ FILENAME: <suggested-filename.md>
     }
 
 
-def move_and_update_doc(filepath: Path, result: dict, docs_dir: Path) -> Path:
-    """Move document to topic folder and update its metadata."""
+# Documents packed into one batched categorization request
+CATEGORIZE_BATCH_SIZE = 10
+
+# Concurrent categorization requests (the Anthropic client is thread-safe)
+CATEGORIZE_WORKERS = 8
+
+BATCH_INSTRUCTIONS = f"""Analyze the Rust-related markdown documents provided by the user and categorize each one.
+
+For every document determine:
+{_TOPIC_TAXONOMY}
+
+Respond with ONLY a strict JSON array, one record per document, keyed by the
+document id, for example:
+[{{"id": 0, "topic": "memory", "title": "Ownership Basics", "filename": "ownership-basics.md"}}]
+"""
+
+
+def categorize_batch_with_claude(filepaths: list[Path], client: anthropic.Anthropic) -> dict:
+    """Categorize several documents with a single Claude request.
+
+    Returns {filepath: {'topic','title','filename'}}. Falls back to per-file
+    calls if the batched JSON response cannot be parsed.
+    """
+    if len(filepaths) == 1:
+        return {filepaths[0]: categorize_with_claude(filepaths[0], client)}
+
+    print(f"Analyzing {len(filepaths)} documents in one batch...")
+
+    # Share the context budget across the batch
+    per_doc_limit = 50000 // len(filepaths)
+
+    blocks = []
+    for i, filepath in enumerate(filepaths):
+        size = filepath.stat().st_size
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read(per_doc_limit)
+        if size > per_doc_limit:
+            content += "\n\n[Content truncated...]"
+        blocks.append(f'<document id="{i}">\n{content}\n</document>')
+
+    message = client.messages.create(
+        model=CATEGORIZE_MODEL,
+        max_tokens=150 * len(filepaths),
+        system=[{
+            "type": "text",
+            "text": BATCH_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"},
+        }],
+        messages=[{"role": "user", "content": "\n\n".join(blocks)}]
+    )
+    _log_cache_usage(message)
+
+    response_text = message.content[0].text.strip()
+
+    # Tolerate a fenced code block around the JSON
+    if response_text.startswith('```'):
+        response_text = response_text.strip('`')
+        response_text = response_text[response_text.find('['):response_text.rfind(']') + 1]
+
+    try:
+        records = json.loads(response_text)
+        results = {}
+        for record in records:
+            filepath = filepaths[int(record['id'])]
+            topic = (record.get('topic') or '').lower()
+            if not topic or topic == 'misc' or not record.get('title'):
+                # Weak record: re-run just this file, which escalates to
+                # the fallback model on its own
+                results[filepath] = categorize_with_claude(filepath, client)
+                continue
+            results[filepath] = {
+                'topic': topic,
+                'title': record['title'],
+                'filename': record.get('filename') or filepath.name,
+            }
+        if set(results) == set(filepaths):
+            return results
+        print("  Batch response missing documents; falling back to per-file calls")
+    except (ValueError, KeyError, IndexError, TypeError):
+        print("  Could not parse batch response; falling back to per-file calls")
+
+    return {filepath: categorize_with_claude(filepath, client) for filepath in filepaths}
+
+
+def _has_processed_marker(filepath: Path) -> bool:
+    """Check the tail of a file for the ProcessedBy marker."""
+    with open(filepath, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - 4096))
+        return b"<!-- ProcessedBy:" in f.read()
+
+
+def move_and_update_doc(filepath: Path, result: dict, docs_dir: Path,
+                        log: list[str] | None = None) -> Path:
+    """Move document to topic folder and update its metadata.
+
+    When ``log`` is given, status lines are appended there instead of
+    printed, so the caller can flush a whole batch in one write.
+    """
     topic = result['topic']
     filename = result['filename']
     title = result['title']
 
+    note = log.append if log is not None else print
+
     # Create topic folder if needed
     topic_dir = docs_dir / topic
     topic_dir.mkdir(parents=True, exist_ok=True)
 
-    # Read current content
-    content = filepath.read_text()
-
-    # Update H1 title if different
-    h1_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-    if h1_match and h1_match.group(1).strip() != title:
-        content = re.sub(r'^#\s+.+$', f'# {title}', content, count=1, flags=re.MULTILINE)
-    elif not h1_match:
-        content = f'# {title}\n\n{content}'
-
-    # Add metadata marker
-    if "<!-- ProcessedBy:" not in content:
-        content = f"{content}\n\n<!-- ProcessedBy: sync_docs -->\n"
-
     # Determine new path
     new_path = topic_dir / filename
 
@@ -254,68 +484,100 @@ def move_and_update_doc(filepath: Path, result: dict, docs_dir: Path) -> Path:
         new_path = topic_dir / f"{stem}-{counter}.md"
         counter += 1
 
-    # Move file
+    # Fast path: if the H1 (conventionally line 1) already matches, the body
+    # needs no rewrite - move with a rename (one syscall, no data copy) and
+    # append the marker instead of rewriting the whole file
+    with open(filepath, 'rb') as f:
+        head = f.read(1024).decode('utf-8', errors='replace')
+    first_line = head.partition('\n')[0]
+
+    if first_line.startswith('# ') and first_line[2:].strip() == title:
+        if new_path != filepath:
+            os.replace(filepath, new_path)
+            note(f"  Moved to: {new_path.relative_to(docs_dir.parent)}")
+        else:
+            note(f"  Updated in place: {filepath.relative_to(docs_dir.parent)}")
+
+        if not _has_processed_marker(new_path):
+            with open(new_path, 'ab') as f:
+                f.write(b"\n\n<!-- ProcessedBy: sync_docs -->\n")
+
+        return new_path
+
+    # Slow path: the H1 has to change (or be added), so rewrite the content
+    content = filepath.read_text()
+
+    first_line, sep, rest = content.partition('\n')
+    if first_line.startswith('# '):
+        content = f'# {title}{sep}{rest}'
+    else:
+        content = f'# {title}\n\n{content}'
+
+    # Add metadata marker
+    if "<!-- ProcessedBy:" not in content:
+        content = f"{content}\n\n<!-- ProcessedBy: sync_docs -->\n"
+
+    # Write the updated content in place, then move with a single atomic
+    # rename instead of copying to the new path and unlinking the old one
+    filepath.write_text(content)
     if new_path != filepath:
-        new_path.write_text(content)
-        filepath.unlink()
-        print(f"  Moved to: {new_path.relative_to(docs_dir.parent)}")
+        os.replace(filepath, new_path)
+        note(f"  Moved to: {new_path.relative_to(docs_dir.parent)}")
     else:
-        filepath.write_text(content)
-        print(f"  Updated in place: {filepath.relative_to(docs_dir.parent)}")
+        note(f"  Updated in place: {filepath.relative_to(docs_dir.parent)}")
 
     return new_path
 
 
 def git_commit_sync(moved_files: list[tuple[Path, Path]], project_root: Path):
-    """Git add, commit the synced files."""
+    """Git add, commit, and push the synced files."""
     print("\nCommitting changes...")
 
-    try:
-        # Stage all changes in docs/ and mkdocs.yml
-        subprocess.run(
-            ["git", "add", "docs/", "mkdocs.yml"],
-            check=True,
-            capture_output=True,
-            cwd=project_root
-        )
-
-        # Check if there are changes to commit
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--quiet"],
-            capture_output=True,
-            cwd=project_root
-        )
-
-        if result.returncode == 0:
-            print("No changes to commit.")
-            return
+    # Build commit message
+    if len(moved_files) == 1:
+        _, new_path = moved_files[0]
+        commit_msg = f"Organize doc: {new_path.name}"
+    else:
+        commit_msg = f"Organize {len(moved_files)} docs into topic folders"
+
+    # Cheap pre-check: when the worktree is clean for the synced paths,
+    # skip staging (and the shell pipeline) entirely
+    status = subprocess.run(
+        ["git", "status", "--porcelain", "--", "docs/", "mkdocs.yml"],
+        capture_output=True,
+        text=True,
+        cwd=project_root
+    ).stdout
+    if not status.strip():
+        print("No changes to commit.")
+        return
 
-        # Build commit message
-        if len(moved_files) == 1:
-            _, new_path = moved_files[0]
-            commit_msg = f"Organize doc: {new_path.name}"
-        else:
-            commit_msg = f"Organize {len(moved_files)} docs into topic folders"
+    # Stage, check, commit, and push in a single shell invocation instead of
+    # paying fork+exec for four separate git processes
+    cmd = (
+        "git add docs/ mkdocs.yml && "
+        "if git diff --cached --quiet; then echo NOCHANGE; "
+        f"else git commit -m {shlex.quote(commit_msg)} && git push; fi"
+    )
+    result = subprocess.run(
+        cmd,
+        shell=True,
+        executable="/bin/bash",
+        capture_output=True,
+        text=True,
+        cwd=project_root
+    )
 
-        subprocess.run(
-            ["git", "commit", "-m", commit_msg],
-            check=True,
-            capture_output=True,
-            cwd=project_root
-        )
-        print(f"Committed: {commit_msg}")
+    if result.returncode != 0:
+        print(f"Git error: {result.stderr}")
+        return
 
-        # Push
-        subprocess.run(
-            ["git", "push"],
-            check=True,
-            capture_output=True,
-            cwd=project_root
-        )
-        print("Pushed to remote.")
+    if 'NOCHANGE' in result.stdout:
+        print("No changes to commit.")
+        return
 
-    except subprocess.CalledProcessError as e:
-        print(f"Git error: {e.stderr.decode() if e.stderr else e}")
+    print(f"Committed: {commit_msg}")
+    print("Pushed to remote.")
 
 
 def main():
@@ -324,10 +586,7 @@ def main():
     push_flag = '--push' in args
     delete_flag = '--delete' in args
 
-    # Load environment
-    load_dotenv()
-
-    auto_push = push_flag or os.getenv('AUTO_PUSH', '').lower() in ('true', '1', 'yes')
+    auto_push = push_flag or AUTO_PUSH_ENV
 
     # Setup paths
     project_root = Path(__file__).parent
@@ -350,19 +609,22 @@ def main():
             pass
 
     # Need API key for categorization
-    api_key = os.getenv('ANTHROPIC_API_KEY')
+    api_key = API_KEY
     if not api_key:
         print("Error: ANTHROPIC_API_KEY not found in .env file")
         sys.exit(1)
 
     # Git pull first
-    had_changes, deleted_files = git_pull(project_root)
+    had_changes, deleted_files, old_head = git_pull(project_root)
 
-    # Report any files deleted remotely
+    # Report any files deleted remotely, with their titles from the
+    # pre-pull revision
     if deleted_files:
+        titles = _deleted_doc_titles(project_root, old_head, deleted_files)
         print(f"\nDetected {len(deleted_files)} file(s) deleted remotely:")
         for f in deleted_files:
-            print(f"  - {f}")
+            title = titles.get(f)
+            print(f"  - {f} ({title})" if title else f"  - {f}")
 
     # Find uncategorized docs
     uncategorized = find_uncategorized_docs(docs_dir)
@@ -379,19 +641,39 @@ def main():
     for f in uncategorized:
         print(f"  - {f.name}")
 
-    # Process each file
-    client = anthropic.Anthropic(api_key=api_key)
-    moved_files = []
+    # Categorize in batches: one API round-trip covers up to
+    # CATEGORIZE_BATCH_SIZE documents instead of one call per file, and the
+    # batches themselves (network-bound) run concurrently
+    client = _anthropic_client(api_key)
+    batches = [uncategorized[i:i + CATEGORIZE_BATCH_SIZE]
+               for i in range(0, len(uncategorized), CATEGORIZE_BATCH_SIZE)]
+    results = {}
 
     print()
+    if len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=CATEGORIZE_WORKERS) as executor:
+            for partial in executor.map(
+                    lambda batch: categorize_batch_with_claude(batch, client),
+                    batches):
+                results.update(partial)
+    else:
+        results.update(categorize_batch_with_claude(batches[0], client))
+
+    # Moving files stays serial: the dedupe counter and folder creation in
+    # move_and_update_doc aren't thread-safe. Per-file chatter is buffered
+    # and flushed in one write instead of several prints per document
+    moved_files = []
+    lines = []
     for filepath in uncategorized:
-        result = categorize_with_claude(filepath, client)
-        print(f"  Topic: {result['topic']}")
-        print(f"  Title: {result['title']}")
+        result = results[filepath]
+        lines.append(f"  {filepath.name}")
+        lines.append(f"  Topic: {result['topic']}")
+        lines.append(f"  Title: {result['title']}")
 
-        new_path = move_and_update_doc(filepath, result, docs_dir)
+        new_path = move_and_update_doc(filepath, result, docs_dir, log=lines)
         moved_files.append((filepath, new_path))
-        print()
+        lines.append("")
+    _emit(lines)
 
     # Regenerate mkdocs.yml and index.md
     regenerate_mkdocs_nav(docs_dir, project_root)